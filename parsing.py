@@ -54,12 +54,10 @@ def parse_video_fps_file(video_fps_file):
     Returns:
         video_fps (dict): Maps filename to fps.
     """
-    video_fps = dict()
     with open(video_fps_file) as f:
         reader = csv.reader(f)
         next(reader, None)  # Skip headers
-        for row in reader:
-            video_fps[row[0]] = float(row[1])
+        video_fps = {row[0]: float(row[1]) for row in reader}
     return video_fps
 
 
@@ -82,22 +80,17 @@ def parse_annotation_file(annotation_path, video_fps, category):
         for line in f:
             # The THUMOS temporal labels have *two spaces* between the first two
             # fields (unfortunately), while the MultiTHUMOS labels have one
-            # space.
-            details = line.strip().split(' ')
-            if details[1] == '':  # There were two spaces after the first field.
-                details.pop(1)
-            filename, start, end = details
+            # space. split() with no separator handles both.
+            filename, start, end = line.split()
             start, end = float(start), float(end)
             current_fps = video_fps[filename]
-            start_frame = floor(start * current_fps)
-            end_frame = ceil(end * current_fps)
-            annotations.append(Annotation(**{'filename': filename,
-                                             'start_seconds': start,
-                                             'end_seconds': end,
-                                             'start_frame': start_frame,
-                                             'end_frame': end_frame,
-                                             'frames_per_second': current_fps,
-                                             'category': category}))
+            annotations.append(Annotation(filename=filename,
+                                          start_seconds=start,
+                                          end_seconds=end,
+                                          start_frame=floor(start * current_fps),
+                                          end_frame=ceil(end * current_fps),
+                                          frames_per_second=current_fps,
+                                          category=category))
     return annotations
 
 